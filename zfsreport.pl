@@ -9,55 +9,64 @@ my %disks;
 my @temp;
 my $line = "";
 my $pool = "";
+my $rawlist   = "";
+my $rawstatus = "";
+
+# Scrub Scan Line:  scan: scrub repaired <bytes> in <time> with <errors> errors on <date>
+my $scrub_re = qr/^\s+scan: scrub repaired (\d+B) in (\d\d:\d\d:\d\d) with (\d+) errors on\s+(\w{3}\s+\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\d{4})/;
+
+# Pool/VDev Status Line:  NAME  STATE  READ  WRITE  CKSUM
+my $vdev_re = qr/^\s+(\S+)\s+(ONLINE|DEGRADED|FAULTED|OFFLINE|UNAVAIL|REMOVED)\s+(\d+)\s+(\d+)\s+(\d+)\b/;
+
+# Use The C Locale So zpool Output Is Not Localized
+$ENV{'LC_ALL'} = 'C';
+$ENV{'LANG'}   = 'C';
 
 # Get The ZPool Status
-$zpool{'rawlist'} = `zpool list`;
+#   -H  Scripted Mode, No Header And Tab Separated Fields
+#   -p  Exact Values, Sizes In Bytes And Percentages Without The '%'
+#   -o  Only The Columns Used, In A Fixed Order
+$rawlist = `zpool list -H -p -o name,size,alloc,free,frag,cap,health`;
 
 # Get Individual ZPool Status
-@temp = split('\n', $zpool{'rawlist'});
+@temp = split('\n', $rawlist);
 
 foreach $line (@temp) {
-    if ( $line !~ /NAME/ ) {
-        #               $1      $2      $3      $4      $5      $6      $7      $8      $9
-        if ( $line =~ /(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+/ ) {
-            printf("Found Data\n");
-
-            $zpool{$1}{'Size'} = $2;
-            $zpool{$1}{'Used'} = $3;
-            $zpool{$1}{'Free'} = $4;
-            $zpool{$1}{'Frag'} = $7;
-            $zpool{$1}{'Cap'}  = $8;
-            $zpool{$1}{'Health'} = $9;
-        }
+    #   $name   $size   $used   $free   $frag   $cap    $health
+    my ($name, @fields) = split('\t', $line);
+    if ( @fields == 6 ) {
+        printf("Found Data\n");
+
+        @{$zpool{$name}}{qw(Size Used Free Frag Cap Health)} = map { /^\d+$/ ? $_ + 0 : $_ } @fields;
     }
 }
 
 # Debug Print
-foreach $line ( keys %zpool) {
-    printf("$line\n");
+print(map { "$_\n" } keys %zpool);
+print("\n");
+
+# Get The Status Of All Pools In One Call
+$rawstatus = `zpool status`;
+
+# Split The Status Into Per Pool Sections
+foreach my $section (split(/^(?=\s*pool: )/m, $rawstatus)) {
+    if ($section =~ /^\s*pool: (\S+)/) {
+        $zpool{$1}{'rawstatus'} = $section if (exists $zpool{$1});
+    }
 }
-printf("\n");
 
 # Loop over each pool
 foreach $pool ( keys %zpool) {
-    if ( $pool !~ /rawlist/ ) {
-        $zpool{$pool}{'rawstatus'} = `zpool status $pool`;
-
+    if ( exists $zpool{$pool}{'rawstatus'} ) {
         @temp = split('\n', $zpool{$pool}{'rawstatus'});
 
         foreach $line (@temp) {
-            if ($line =~ /^\s+scan: scrub repaired (\d+B) in (\d\d:\d\d:\d\d) with (\d+) errors on ([a-zA-Z0-9:\s]+)/) {
+            if ($line =~ $scrub_re) {
                 printf("Found scan match\n");
-                $zpool{$pool}{'Repaired_Bytes'} = $1;
-                $zpool{$pool}{'Repair_Time'}    = $2;
-                $zpool{$pool}{'Scrub_Errors'}   = $3;
-                $zpool{$pool}{'Scrub_Date'}     = $4;
-           #} elsif ($line =~ /^\s+$pool\s+[a-zA-Z]+\s+(%d+)\s+(%d+)\s+(\d+)/) {
-            } elsif ($line =~ /^\s+$pool\s+[a-zA-Z]+\s+(\d+)\s+(\d+)\s+(\d+)/) {
-                printf("Found $pool match\n");
-                $zpool{$pool}{'Read_Errors'}  = $1;
-                $zpool{$pool}{'Write_Errors'} = $2;
-                $zpool{$pool}{'CKSum_Errors'} = $3;
+                @{$zpool{$pool}}{qw(Repaired_Bytes Repair_Time Scrub_Errors Scrub_Date)} = ($1, $2, $3 + 0, $4);
+            } elsif ($line =~ $vdev_re && $1 eq $pool) {
+                printf("Found %s match\n", $pool);
+                @{$zpool{$pool}}{qw(Read_Errors Write_Errors CKSum_Errors)} = map { $_ + 0 } ($3, $4, $5);
             }
         }
     }